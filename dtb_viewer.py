@@ -2,19 +2,92 @@
 
 import sys
 import os
+import bisect
+import logging
 import re
-import subprocess
-import uuid
 from pathlib import Path
 import json
 from xdg_utils import get_xdg_data_dir
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QTabWidget,
-    QTextEdit, QPushButton, QFileDialog, QMessageBox, QInputDialog
+    QPlainTextEdit, QPlainTextDocumentLayout, QPushButton, QFileDialog,
+    QMessageBox, QLineEdit
 )
-from PyQt6.QtGui import QAction, QKeySequence, QTextDocument, QTextCursor
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QFont, QKeySequence, QShortcut, QTextDocument, QTextCursor
+from PyQt6.QtCore import Qt, QProcess, QThread, QTimer, pyqtSignal
+
+# Matches the temporary /tmp/BASENAME-UUID.dts paths in dtc output.
+# UUID is 32 hex digits in the usual 8-4-4-4-12 grouping.
+_DTC_TMP_PATTERN = (
+    r"/tmp/([^-]+)-[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+    r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\.dts"
+)
+_DTC_TMP_RE = re.compile(_DTC_TMP_PATTERN)
+
+# google-re2 matches in guaranteed linear time, which pays off when a DTB
+# produces thousands of dtc warnings. Entirely optional; we fall back to
+# the compiled stdlib pattern when it is not installed.
+try:
+    import re2 as _re2
+    _DTC_TMP_RE2 = _re2.compile(_DTC_TMP_PATTERN)
+except ImportError:
+    _DTC_TMP_RE2 = None
+
+
+# DTS documents below this size load fast enough synchronously; above it
+# the block-splitting work is pushed off the GUI thread.
+_ASYNC_DTS_THRESHOLD = 1 << 20
+
+# Blocks scanned per idle tick of the incremental find; big enough to finish
+# typical documents in a few ticks, small enough to never block a frame.
+_FIND_BATCH_BLOCKS = 2048
+
+# Single characters match almost every line of a DTS; don't start scanning
+# until the debounced term is at least this long. Enter still forces a find.
+_MIN_FIND_LENGTH = 2
+
+# Pathological DTBs can make dtc emit tens of thousands of warnings; cap what
+# is rendered in the Issues view so UI work stays bounded. The tab label
+# still reports the full count.
+_MAX_ISSUE_LINES = 2000
+
+# Successful dtc runs remembered per (path, mtime_ns, size); re-opening an
+# unchanged DTB becomes a dict lookup instead of a process spawn.
+_DTC_CACHE_SIZE = 4
+
+# Diagnostic chatter is opt-in; a synchronous print to a slow terminal can
+# stall the GUI thread, so it stays off unless explicitly requested.
+_DEBUG = bool(os.environ.get("DTB_VIEWER_DEBUG"))
+_logger = logging.getLogger(__name__)
+
+
+class _DtsDocumentBuilder(QThread):
+    """
+    Builds a QTextDocument for large DTS content off the GUI thread.
+
+    Splitting a multi-megabyte text into blocks is the expensive part of
+    displaying it; doing that on a detached document keeps the UI
+    responsive, and the final setDocument() swap is O(1).
+    """
+
+    document_ready = pyqtSignal(QTextDocument)
+
+    def __init__(self, text, font, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._font = font
+
+    def run(self):
+        doc = QTextDocument()
+        # QPlainTextEdit only accepts documents with a plain-text layout.
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setUndoRedoEnabled(False) # viewer-only; skip undo bookkeeping
+        doc.setDefaultFont(self._font)
+        doc.setPlainText(self._text)
+        # Hand ownership back to the GUI thread before announcing the result.
+        doc.moveToThread(QApplication.instance().thread())
+        self.document_ready.emit(doc)
 
 
 class DTBViewerApp(QMainWindow):
@@ -23,20 +96,71 @@ class DTBViewerApp(QMainWindow):
         self.setWindowTitle("DTB Viewer")
         self.setGeometry(100, 100, 800, 600)
 
-        self.current_dts_content = ""
         self.current_dtb_basename = "Untitled"
-        self.current_out_dts_tmp_file = None
 
-        self.recent_files = []
+        # DTS text waiting to be pushed into the widget; populating a large
+        # document is expensive, so it is deferred until the tab is visible.
+        self._pending_dts = None
+        self._dts_dirty = False
+        # Worker building a QTextDocument for the current large DTS, if any.
+        self._dts_builder = None
+
+        # dtc runs asynchronously so the event loop keeps pumping paint and
+        # input events while large blobs decompile. stderr streams into the
+        # Issues tab as it arrives; stdout is collected when dtc finishes.
+        self._current_dtb_path = None
+        self._issues_count = 0
+        self._issues_shown = 0
+        self._stderr_tail = ""
+        self._dtc_cancelled = False
+        # stdout chunks drained while dtc runs; joined and decoded once at
+        # the end instead of letting the channel buffer grow unserviced.
+        self._stdout_chunks = []
+        # Raw DTS bytes exactly as dtc produced them; the view is read-only,
+        # so Save-As can write these without a decode/encode round trip.
+        self._dts_bytes = None
+        # LRU of successful runs (insertion-ordered dict, oldest first), each
+        # value (dts_bytes, rendered issues text, issues count).
+        self._dtc_cache = {}
+        self._dtc_cache_key = None
+        self.dtc_proc = QProcess(self)
+        self.dtc_proc.readyReadStandardOutput.connect(self._on_dtc_stdout)
+        self.dtc_proc.readyReadStandardError.connect(self._on_dtc_stderr)
+        self.dtc_proc.finished.connect(self._on_dtc_finished)
+        self.dtc_proc.errorOccurred.connect(self._on_dtc_error)
+
+        # Insertion-ordered dict used as an ordered set of absolute paths,
+        # newest first: O(1) membership instead of a list scan per open.
+        self.recent_files = {}
         self.MAX_RECENT_FILES = 10
+        # Set when the list changed but has not been written to disk yet.
+        self._recent_dirty = False
+        # Resolve once; get_xdg_data_dir() stats/creates directories and the
+        # path never changes within a session.
+        data_dir = get_xdg_data_dir()
+        self._recent_files_path = data_dir / "recent_files.txt"
+        # Earlier versions stored the list as JSON; read once for migration.
+        self._legacy_recent_files_path = data_dir / "recent_files.json"
         self.load_recent_files()
 
         self.last_search_term = ""
-        # Default flags: Case-insensitive. Change if needed.
-        # QTextDocument.FindFlag(0) is equivalent to no flags, which means case-insensitive by default
-        # for QTextEdit.find(). If you want explicit case insensitivity, use:
-        # self.last_find_flags = QTextDocument.FindFlag.FindCaseSensitively if you want case-sensitive
-        self.last_find_flags = QTextDocument.FindFlag(0) # Default behavior is case-insensitive
+        # Where the current incremental search started; typing extends the
+        # search from here instead of from wherever the last match ended.
+        # Matching is case-insensitive, as QPlainTextEdit.find() was.
+        self._last_find_position = 0
+        # Background-scan bookkeeping; the token invalidates in-flight scans.
+        self._find_state = None
+        self._find_token = 0
+        # Sorted positions of matches discovered so far for the cached term;
+        # Find Next/Previous serve O(1) jumps from here. The DTS view is
+        # read-only, so only a new term or a new document invalidates it.
+        self._find_cache_term = None
+        self._find_matches = []
+        # Debounce timer so a burst of keystrokes triggers a single search.
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self._do_find)
 
         self._init_ui() # recent_files_menu is created here
         self.update_recent_files_menu() # Populate menu on startup
@@ -45,35 +169,49 @@ class DTBViewerApp(QMainWindow):
             self.process_dtb_file(initial_dtb_file)
 
     def load_recent_files(self):
-        data_dir = get_xdg_data_dir()
-        recent_files_path = data_dir / "recent_files.json"
-        if recent_files_path.exists():
-            try:
-                with open(recent_files_path, "r", encoding="utf-8") as f:
-                    self.recent_files = json.load(f)
-            except (FileNotFoundError, IOError, json.JSONDecodeError) as e:
-                print(f"Warning: Could not load recent files: {e}", file=sys.stderr)
-                self.recent_files = []
-        else:
-            self.recent_files = []
+        try:
+            if self._recent_files_path.exists():
+                # One path per line; no JSON parsing on the startup path.
+                lines = self._recent_files_path.read_text(encoding="utf-8").splitlines()
+                self.recent_files = dict.fromkeys(line for line in lines if line)
+            elif self._legacy_recent_files_path.exists():
+                with open(self._legacy_recent_files_path, "r", encoding="utf-8") as f:
+                    self.recent_files = dict.fromkeys(json.load(f))
+            else:
+                self.recent_files = {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not load recent files: {e}", file=sys.stderr)
+            self.recent_files = {}
+
+    def _flush_recent_files(self):
+        if self._recent_dirty:
+            self._recent_dirty = False
+            self.save_recent_files()
 
     def save_recent_files(self):
-        data_dir = get_xdg_data_dir()
-        recent_files_path = data_dir / "recent_files.json"
+        # Write to a sibling temp file and rename into place so a crash
+        # mid-write cannot corrupt the existing list.
+        tmp_path = self._recent_files_path.with_suffix(".txt.tmp")
         try:
-            with open(recent_files_path, "w", encoding="utf-8") as f:
-                json.dump(self.recent_files, f)
-        except (IOError, json.JSONEncodeError) as e: # Changed from general Exception to more specific
+            tmp_path.write_text("\n".join(self.recent_files), encoding="utf-8")
+            os.replace(tmp_path, self._recent_files_path)
+        except OSError as e:
             print(f"Warning: Could not save recent files: {e}", file=sys.stderr)
 
     def add_to_recent_files(self, file_path_str: str):
-        abs_file_path = str(Path(file_path_str).resolve())
-        if abs_file_path in self.recent_files:
-            self.recent_files.remove(abs_file_path)
-        self.recent_files.insert(0, abs_file_path)
-        self.recent_files = self.recent_files[:self.MAX_RECENT_FILES]
-        self.save_recent_files()
-        self.update_recent_files_menu() # This will be implemented later
+        # abspath is pure string normalization; resolve() would stat every
+        # path component just for bookkeeping.
+        abs_file_path = os.path.abspath(file_path_str)
+        self.recent_files.pop(abs_file_path, None)
+        # Rebuild with the new path first; cheap for <= MAX_RECENT_FILES keys.
+        self.recent_files = {abs_file_path: None, **self.recent_files}
+        while len(self.recent_files) > self.MAX_RECENT_FILES:
+            self.recent_files.popitem() # drops the last (oldest) entry
+        # Opening a file is the hot path; push the disk write to the next
+        # idle cycle instead of paying for it before the DTS is shown.
+        self._recent_dirty = True
+        QTimer.singleShot(0, self._flush_recent_files)
+        self.update_recent_files_menu()
 
     def _init_ui(self):
         # --- Menu Bar ---
@@ -81,10 +219,10 @@ class DTBViewerApp(QMainWindow):
 
         # File Menu
         file_menu = menu_bar.addMenu("&File")
-        open_action = QAction("&Open DTB...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self.open_dtb_dialog)
-        file_menu.addAction(open_action)
+        self.open_action = QAction("&Open DTB...", self)
+        self.open_action.setShortcut(QKeySequence.StandardKey.Open)
+        self.open_action.triggered.connect(self.open_dtb_dialog)
+        file_menu.addAction(self.open_action)
 
         self.save_dts_action = QAction("&Save DTS As...", self)
         self.save_dts_action.setShortcut(QKeySequence.StandardKey.SaveAs)
@@ -93,7 +231,25 @@ class DTBViewerApp(QMainWindow):
         file_menu.addAction(self.save_dts_action)
 
         self.recent_files_menu = file_menu.addMenu("Open Recent")
-        # self.update_recent_files_menu() # Called after UI setup and after loading recent files
+        # Persistent menu entries: update_recent_files_menu() retargets their
+        # text/tooltip/visibility instead of recreating QActions (and fresh
+        # lambda connections) on every list change.
+        self._no_recent_action = QAction("No Recent Files", self)
+        self._no_recent_action.setEnabled(False)
+        self.recent_files_menu.addAction(self._no_recent_action)
+        self._recent_actions = []
+        for i in range(self.MAX_RECENT_FILES):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(
+                lambda checked=False, index=i: self._open_recent_at(index)
+            )
+            self.recent_files_menu.addAction(action)
+            self._recent_actions.append(action)
+        self._recent_separator = self.recent_files_menu.addSeparator()
+        self._clear_recent_action = QAction("Clear Recent Files List", self)
+        self._clear_recent_action.triggered.connect(self.clear_recent_files_list_action)
+        self.recent_files_menu.addAction(self._clear_recent_action)
 
         file_menu.addSeparator()
 
@@ -109,18 +265,46 @@ class DTBViewerApp(QMainWindow):
         self.find_action.triggered.connect(self.handle_find_request)
         self.find_action.setEnabled(False) # Disabled initially
         edit_menu.addAction(self.find_action)
+
+        self.find_next_action = QAction("Find &Next", self)
+        self.find_next_action.setShortcut(QKeySequence.StandardKey.FindNext) # F3
+        self.find_next_action.triggered.connect(self._find_next)
+        self.find_next_action.setEnabled(False)
+        edit_menu.addAction(self.find_next_action)
+
+        self.find_prev_action = QAction("Find &Previous", self)
+        self.find_prev_action.setShortcut(QKeySequence.StandardKey.FindPrevious) # Shift+F3
+        self.find_prev_action.triggered.connect(self._find_prev)
+        self.find_prev_action.setEnabled(False)
+        edit_menu.addAction(self.find_prev_action)
         
         # --- Tab Widget ---
         self.tab_widget = QTabWidget()
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         self.setCentralWidget(self.tab_widget)
 
         # --- Tab 1: DTS Content ---
         self.dts_tab = QWidget()
         dts_layout = QVBoxLayout(self.dts_tab)
 
-        self.dts_text_edit = QTextEdit()
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Find in DTS (Esc to hide)")
+        self.search_bar.setVisible(False)
+        self.search_bar.textChanged.connect(self._on_search_text_changed)
+        self.search_bar.returnPressed.connect(self._find_next)
+        esc_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self.search_bar)
+        esc_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+        esc_shortcut.activated.connect(self._hide_search_bar)
+        dts_layout.addWidget(self.search_bar)
+
+        # QPlainTextEdit is optimized for large plain-text documents,
+        # unlike QTextEdit's rich-text layout engine.
+        self.dts_text_edit = QPlainTextEdit()
         self.dts_text_edit.setReadOnly(True)
-        self.dts_text_edit.setFontFamily("Monospace") # Good for code/DTS
+        self.dts_text_edit.setFont(QFont("Monospace")) # Good for code/DTS
+        # DTS sources can contain very long property lines; skipping wrap
+        # calculation keeps layout cost at O(visible lines).
+        self.dts_text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         dts_layout.addWidget(self.dts_text_edit)
 
         self.save_dts_button = QPushButton("Save DTS As...")
@@ -128,79 +312,238 @@ class DTBViewerApp(QMainWindow):
         self.save_dts_button.setEnabled(False)
         dts_layout.addWidget(self.save_dts_button)
 
+        # Only visible while a dtc run is in flight.
+        self.cancel_dtc_button = QPushButton("Cancel dtc")
+        self.cancel_dtc_button.clicked.connect(self.cancel_dtc_run)
+        self.cancel_dtc_button.setVisible(False)
+        dts_layout.addWidget(self.cancel_dtc_button)
+
         self.tab_widget.addTab(self.dts_tab, "DTS Output") # Placeholder name
 
-        # --- Tab 2: Issues ---
+        # The Issues tab is built lazily in _ensure_issues_tab(); most
+        # successful dtc runs produce no issues at all.
+        self.issues_tab = None
+        self.issues_text_edit = None
+
+        # The view is read-only; an undo stack would only record every bulk
+        # set/append as undoable state, doubling peak memory.
+        self.dts_text_edit.document().setUndoRedoEnabled(False)
+
+    def _ensure_issues_tab(self):
+        """Builds the Issues tab the first time something lands in it."""
+        if self.issues_text_edit is not None:
+            return
         self.issues_tab = QWidget()
         issues_layout = QVBoxLayout(self.issues_tab)
 
-        self.issues_text_edit = QTextEdit()
+        self.issues_text_edit = QPlainTextEdit()
         self.issues_text_edit.setReadOnly(True)
-        self.issues_text_edit.setFontFamily("Monospace") # Good for logs
+        self.issues_text_edit.setFont(QFont("Monospace")) # Good for logs
+        self.issues_text_edit.setCenterOnScroll(True) # Log-style scrolling
+        self.issues_text_edit.document().setUndoRedoEnabled(False)
         issues_layout.addWidget(self.issues_text_edit)
 
-        self.tab_widget.addTab(self.issues_tab, "Issues (0)") # Placeholder name
+        self.tab_widget.addTab(self.issues_tab, "Issues (0)")
+
+    def _append_issue(self, text):
+        self._ensure_issues_tab()
+        self.issues_text_edit.appendPlainText(text)
+
+    def _update_issues_tab_label(self):
+        if self.issues_tab is not None:
+            self.tab_widget.setTabText(self.tab_widget.indexOf(self.issues_tab),
+                                       f"Issues ({self._issues_count})")
 
-    def _reformat_dtc_output_line(self, line: str) -> str:
+    def _reformat_dtc_output_bulk(self, text: str) -> str:
         """
-        Reformats dtc output lines to replace temporary filenames with original basenames.
-        Example: /tmp/BASENAME-UUID.dts -> BASENAME.dts
+        Reformats dtc output to replace temporary filenames with original
+        basenames (/tmp/BASENAME-UUID.dts -> BASENAME.dts), a whole block
+        at a time before any line splitting. Uses google-re2's linear-time
+        engine when available, the compiled stdlib pattern otherwise.
         """
-        # Regex to find /tmp/BASENAME-UUID.dts
-        # UUID is 32 hex digits, typically 8-4-4-4-12
-        pattern = r"/tmp/([^-]+)-[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\.dts"
-        replacement = r"\1.dts"
-
-        reformatted_line, num_subs = re.subn(pattern, replacement, line)
-        if num_subs > 0:
-            return reformatted_line
-        return line
+        # C-level substring checks gate out the vast majority of output far
+        # more cheaply than starting the regex engine.
+        if "/tmp/" not in text or ".dts" not in text:
+            return text
+        if _DTC_TMP_RE2 is not None:
+            return _DTC_TMP_RE2.sub(r"\1.dts", text)
+        return _DTC_TMP_RE.sub(r"\1.dts", text)
 
     def handle_find_request(self):
-        if self.tab_widget.currentWidget() != self.dts_tab or not self.dts_text_edit.toPlainText():
+        # document().isEmpty() is O(1); toPlainText() would materialize the
+        # whole multi-MB buffer just to test emptiness.
+        if self.tab_widget.currentWidget() != self.dts_tab or self.dts_text_edit.document().isEmpty():
             QMessageBox.information(self, "Find", "No DTS content to search in, or DTS tab not active.")
             return
 
-        self.dts_text_edit.setFocus() # Ensure the text edit has focus
-
-        search_term, ok = QInputDialog.getText(
-            self,
-            "Find Text",
-            "Enter text to find:",
-            text=self.last_search_term # Pre-fill with last search term
-        )
-
-        if ok and search_term:
-            self.last_search_term = search_term
-            # You can add a dialog here to ask for find flags (e.g., case sensitive)
-            # For now, using self.last_find_flags (default: case-insensitive)
-            
-            # Try to find from current cursor position
-            # QTextEdit.find() searches forward from the current cursor position.
-            # If found, it selects the text and returns True.
-            found = self.dts_text_edit.find(self.last_search_term, self.last_find_flags)
-
-            if not found:
-                # If not found from the current position, ask the user if they want to search from the beginning
-                reply = QMessageBox.question(self, 'Find Text',
-                                             f"Text '{self.last_search_term}' not found from current position.\nSearch from the beginning?",
-                                             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                             QMessageBox.StandardButton.No)
-                if reply == QMessageBox.StandardButton.Yes:
-                    # Move cursor to the beginning of the document
-                    cursor = self.dts_text_edit.textCursor()
-                    cursor.movePosition(QTextCursor.MoveOperation.Start)
-                    self.dts_text_edit.setTextCursor(cursor)
-                    found = self.dts_text_edit.find(self.last_search_term, self.last_find_flags)
-            
-            if not found: # If still not found after potentially searching from start
-                 QMessageBox.information(self, "Find Text", f"Text '{self.last_search_term}' not found.")
-        elif ok and not search_term: # User pressed OK but entered no text
-            # Clear any existing selection if desired, or do nothing
-            cursor = self.dts_text_edit.textCursor()
+        # Anchor the incremental search at the current selection/cursor.
+        self._last_find_position = self.dts_text_edit.textCursor().selectionStart()
+        self.search_bar.setVisible(True)
+        self.search_bar.setFocus()
+        self.search_bar.selectAll()
+
+    def _hide_search_bar(self):
+        self.search_bar.setVisible(False)
+        self.dts_text_edit.setFocus()
+
+    def _on_search_text_changed(self, _text):
+        # Restarting the timer coalesces a burst of keystrokes into one search.
+        self._search_debounce.start()
+
+    def _do_find(self):
+        """Runs the debounced incremental search from the anchor position."""
+        search_term = self.search_bar.text()
+        self.last_search_term = search_term
+        self._find_token += 1 # invalidates any in-flight background scan
+        self._find_state = None
+        te = self.dts_text_edit
+        if not search_term:
+            cursor = te.textCursor()
             if cursor.hasSelection():
                 cursor.clearSelection()
-                self.dts_text_edit.setTextCursor(cursor)
+                te.setTextCursor(cursor)
+            return
+
+        if len(search_term) < _MIN_FIND_LENGTH:
+            return
+
+        self._reset_find_cache(search_term)
+
+        doc = te.document()
+        # Phase 1: scan the visible blocks synchronously so the first hit
+        # lands within one frame regardless of document size.
+        vp_rect = te.viewport().rect()
+        first_visible = te.cursorForPosition(vp_rect.topLeft()).blockNumber()
+        last_visible = te.cursorForPosition(vp_rect.bottomRight()).blockNumber()
+        term_lower = search_term.lower()
+        pos = self._scan_block_range(doc, term_lower, first_visible,
+                                     last_visible + 1, self._last_find_position)
+        if pos >= 0:
+            self._select_match(pos, len(search_term))
+            return
+
+        # Phase 2: scan the rest of the document in idle-time batches,
+        # starting at the anchor and wrapping around once.
+        self._start_background_find(search_term)
+
+    def _reset_find_cache(self, search_term):
+        if self._find_cache_term != search_term:
+            self._find_cache_term = search_term
+            self._find_matches = []
+
+    def _find_next(self):
+        """Advances to the next match (Enter in the search bar, or F3)."""
+        search_term = self.search_bar.text() or self.last_search_term
+        if not search_term or self.dts_text_edit.document().isEmpty():
+            return
+        self._reset_find_cache(search_term)
+        # Serve from already-discovered matches when possible: O(1) versus
+        # re-scanning the document.
+        matches = self._find_matches
+        if matches:
+            current = self.dts_text_edit.textCursor().selectionStart()
+            idx = bisect.bisect_right(matches, current)
+            if idx < len(matches):
+                self._select_match(matches[idx], len(search_term))
+                return
+        # Searching forward from the selection end skips the current match.
+        self._last_find_position = self.dts_text_edit.textCursor().selectionEnd()
+        self._find_token += 1
+        self._start_background_find(search_term)
+
+    def _find_prev(self):
+        """Steps back to the previous already-discovered match (Shift+F3)."""
+        search_term = self.search_bar.text() or self.last_search_term
+        if not search_term or search_term != self._find_cache_term:
+            return
+        matches = self._find_matches
+        if not matches:
+            return
+        current = self.dts_text_edit.textCursor().selectionStart()
+        idx = bisect.bisect_left(matches, current) - 1
+        if idx < 0:
+            idx = len(matches) - 1 # wrap to the last known match
+        self._select_match(matches[idx], len(search_term))
+
+    def _start_background_find(self, search_term):
+        doc = self.dts_text_edit.document()
+        anchor_block = doc.findBlock(self._last_find_position).blockNumber()
+        self._find_state = {
+            "token": self._find_token,
+            "term_lower": search_term.lower(),
+            "term_len": len(search_term),
+            "next_block": anchor_block,
+            "end_block": doc.blockCount(),
+            "min_pos": self._last_find_position,
+            "anchor_block": anchor_block,
+            "wrapped": False,
+        }
+        QTimer.singleShot(0, self._find_step)
+
+    def _find_step(self):
+        """Scans one batch of blocks, then yields back to the event loop."""
+        state = self._find_state
+        if state is None or state["token"] != self._find_token:
+            return # superseded by a newer search or a cleared view
+        # Unpack once; dict probes add up over the many ticks a large
+        # document needs.
+        next_block = state["next_block"]
+        end_block = state["end_block"]
+        doc = self.dts_text_edit.document()
+        batch_end = min(next_block + _FIND_BATCH_BLOCKS, end_block)
+        pos = self._scan_block_range(doc, state["term_lower"], next_block,
+                                     batch_end, state["min_pos"])
+        if pos >= 0:
+            self._find_state = None
+            self._select_match(pos, state["term_len"])
+            return
+        state["next_block"] = batch_end
+        if batch_end >= end_block:
+            if state["wrapped"]:
+                self._find_state = None
+                return # no match anywhere in the document
+            # Wrap around once: top of the document back to the anchor block.
+            state["wrapped"] = True
+            state["next_block"] = 0
+            state["end_block"] = state["anchor_block"] + 1
+            state["min_pos"] = -1
+        QTimer.singleShot(0, self._find_step)
+
+    def _scan_block_range(self, doc, term_lower, start_block, end_block, min_pos):
+        """
+        Case-insensitively searches blocks [start_block, end_block) and
+        returns the absolute position of the first match at or after
+        min_pos, or -1. Works per-block, so cost is bounded by the range.
+        """
+        block = doc.findBlockByNumber(start_block)
+        block_number = start_block
+        while block.isValid() and block_number < end_block:
+            if min_pos >= 0:
+                offset = min_pos - block.position()
+                if offset <= 0:
+                    # Past the anchor; stop paying for the offset from here on.
+                    min_pos = -1
+                    offset = 0
+            else:
+                offset = 0
+            idx = block.text().lower().find(term_lower, offset)
+            if idx >= 0:
+                return block.position() + idx
+            block = block.next()
+            block_number += 1
+        return -1
+
+    def _select_match(self, pos, length):
+        # Remember every match we land on so next/previous can reuse it.
+        idx = bisect.bisect_left(self._find_matches, pos)
+        if idx == len(self._find_matches) or self._find_matches[idx] != pos:
+            self._find_matches.insert(idx, pos)
+        te = self.dts_text_edit
+        cursor = te.textCursor()
+        cursor.setPosition(pos)
+        cursor.setPosition(pos + length, QTextCursor.MoveMode.KeepAnchor)
+        te.setTextCursor(cursor)
+        te.centerCursor()
 
     def open_dtb_dialog(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -220,181 +563,257 @@ class DTBViewerApp(QMainWindow):
             self.clear_views()
             return
 
-        self.current_dtb_basename = in_dtb_file_path.name
-        random_uuid_str = str(uuid.uuid4())
-        out_dts_filename = f"{in_dtb_file_path.stem}-{random_uuid_str}.dts"
-        
-        tmp_dir = Path("/tmp")
-        if not tmp_dir.exists() or not os.access(tmp_dir, os.W_OK):
-            try:
-                import tempfile
-                tmp_dir_fallback = Path(tempfile.gettempdir())
-                if not tmp_dir_fallback.exists() or not os.access(tmp_dir_fallback, os.W_OK):
-                    raise OSError("System temp directory also not accessible.")
-                tmp_dir = tmp_dir_fallback
-                print(f"Warning: /tmp not available or writable. Using system temp directory: {tmp_dir}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Cannot access /tmp or system temp directory: {e}")
-                self.clear_views()
-                return
-
-        self.current_out_dts_tmp_file = tmp_dir / out_dts_filename
-
-        dtc_command = [
-            "dtc",
-            "-I", "dtb",
-            "-O", "dts",
-            str(in_dtb_file_path),
-            "-o", str(self.current_out_dts_tmp_file)
-        ]
-
-        dts_content = ""
-        stderr_lines = []
-        issues_count = 0
-        dtc_success = False # Flag to track if dtc actually produced a usable .dts file
-
-        try:
-            print(f"Running command: {' '.join(dtc_command)}")
-            process = subprocess.run(
-                dtc_command,
-                capture_output=True,
-                text=True, # Decodes stdout/stderr as text
-                check=False # We check returncode manually
-            )
+        if self.dtc_proc.state() != QProcess.ProcessState.NotRunning:
+            QMessageBox.information(self, "Busy", "Another DTB file is still being processed.")
+            return
 
-            if process.stderr:
-                stderr_lines = process.stderr.strip().splitlines()
-                stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-                issues_count = len(stderr_lines)
-            else: # process.stderr was empty, initialize stderr_lines if it wasn't already
-                stderr_lines = []
-
-
-            if process.returncode == 0:
-                if self.current_out_dts_tmp_file.is_file():
-                    with open(self.current_out_dts_tmp_file, "r", encoding="utf-8", errors="replace") as f:
-                        dts_content = f.read()
-                    dtc_success = True # dtc ran and output file exists
-                    self.add_to_recent_files(str(in_dtb_file_path))
-                    if not stderr_lines: # If dtc was successful and process.stderr was empty
-                        stderr_lines.append("dtc command executed successfully.")
-                    # Apply reformatting to all lines in stderr_lines, including the newly added one.
-                    stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-                    issues_count = len(stderr_lines) # Update count
-                else:
-                    # dtc reported success, but file is missing - this is an error condition
-                    dts_content = f"Error: dtc ran successfully but output file {self.current_out_dts_tmp_file} was not created."
-                    stderr_lines.append(dts_content) # Add to issues
-                    stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-                    issues_count = len(stderr_lines)
-                    dtc_success = False # Treat as failure for enabling features
+        self.current_dtb_basename = in_dtb_file_path.name
+        self._current_dtb_path = in_dtb_file_path
+
+        # An unchanged DTB (same path, mtime and size) decompiles to the same
+        # DTS; serve it from the cache instead of re-running dtc.
+        st = in_dtb_file_path.stat()
+        cache_key = (str(in_dtb_file_path), st.st_mtime_ns, st.st_size)
+        hit = self._dtc_cache.get(cache_key)
+        if hit is not None:
+            self._dtc_cache.pop(cache_key) # re-insert to refresh LRU order
+            self._dtc_cache[cache_key] = hit
+            dts_bytes, issues_text, issues_count = hit
+            self._dts_bytes = dts_bytes
+            self._issues_count = issues_count
+            # Mirror the miss path: drop the previous file's issues before
+            # optionally repopulating, so a cached clean run doesn't keep
+            # showing them under an "Issues (0)" label.
+            if self.issues_text_edit is not None:
+                self.issues_text_edit.clear()
+            if issues_text:
+                self._ensure_issues_tab()
+                self.issues_text_edit.setPlainText(issues_text)
             else:
-                # dtc failed
-                error_message = f"dtc command failed with exit code {process.returncode}."
-                dts_content = error_message # Display error in DTS tab as well
-                # stderr_lines might have content from process.stderr (already reformatted) or be empty.
-                if not stderr_lines: # if dtc failed and process.stderr produced no output
-                    stderr_lines.append(error_message)
-                    # No reformatting needed for this specific error_message
-                else: # if dtc failed and process.stderr produced output (already reformatted)
-                    # Prepend the new error message, which itself doesn't need reformatting.
-                    # The existing lines in stderr_lines are already reformatted.
-                    stderr_lines.insert(0, error_message)
-                # Reformat all lines in case new unformatted lines were added (though error_message itself is not a path)
-                # This ensures consistency if stderr_lines had previous content + new content.
-                # However, error_message is not a file path.
-                # The lines from process.stderr are already formatted.
-                # So, only reformat if we appended a simple error message to an empty list.
-                # Let's ensure any line that *could* be a path is reformatted.
-                # The first block `if process.stderr:` handles lines from dtc.
-                # Subsequent appends/inserts are typically error messages not paths.
-                # The most direct approach is to reformat `stderr_lines` after any modification *if* new lines could be paths.
-                # Given `error_message` is not a path, no reformatting needed for it.
-                # stderr_lines content from `process.stderr` is already formatted.
-                # So, no additional reformatting call is strictly needed here if logic is sequential.
-                # For safety, a final reformat before `setPlainText` might be an option,
-                # but the prompt asks for it at specific points.
-                # Apply reformatting to all lines in stderr_lines, including the newly added/inserted one.
-                stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-                issues_count = len(stderr_lines)
-                QMessageBox.warning(self, "DTC Execution Failed",
-                                    f"{error_message}\nCheck the 'Issues' tab for details.")
-                dtc_success = False
-
-
-        except FileNotFoundError:
-            dts_content = "Error: 'dtc' command not found. Please ensure it is installed and in your PATH."
-            stderr_lines = [dts_content]
-            stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-            issues_count = 1
-            dtc_success = False
-            QMessageBox.critical(self, "Error", dts_content)
-        except Exception as e:
-            dts_content = f"An unexpected error occurred during dtc execution: {e}"
-            stderr_lines = [str(e)]
-            stderr_lines = [self._reformat_dtc_output_line(line) for line in stderr_lines]
-            issues_count = 1
-            dtc_success = False
+                self.statusBar().showMessage("dtc command executed successfully.", 5000)
+            self.add_to_recent_files(str(in_dtb_file_path))
+            self._finish_dtc_run(dts_bytes.decode("utf-8", errors="replace"),
+                                 dtc_success=True)
+            return
+        self._dtc_cache_key = cache_key
+
+        # Reset per-run state; stderr streams in while dtc is running.
+        self._issues_count = 0
+        self._issues_shown = 0
+        self._stderr_tail = ""
+        self._dtc_cancelled = False
+        self._stdout_chunks = []
+        if self.issues_text_edit is not None:
+            self.issues_text_edit.clear()
+        self._update_issues_tab_label()
+        self.open_action.setEnabled(False)
+        # Save/find would act on the previous file's content while dtc runs
+        # (and the suggested save name already reflects the new DTB); keep
+        # them off until _finish_dtc_run() publishes the new content.
+        self.save_dts_action.setEnabled(False)
+        self.save_dts_button.setEnabled(False)
+        self.find_action.setEnabled(False)
+        self.find_next_action.setEnabled(False)
+        self.find_prev_action.setEnabled(False)
+        self.cancel_dtc_button.setVisible(True)
+
+        # Write the DTS to stdout ("-o -") so we capture it directly instead
+        # of round-tripping through a temp file that needs cleanup. "-q"
+        # suppresses dtc's style warnings so stderr carries real errors only,
+        # which keeps the Issues tab (and its reformatting pass) quiet for
+        # the common case.
+        dtc_args = ["-I", "dtb", "-O", "dts", "-q", str(in_dtb_file_path), "-o", "-"]
+        if _DEBUG:
+            _logger.debug("Running command: dtc %s", " ".join(dtc_args))
+        self.dtc_proc.start("dtc", dtc_args)
+
+    def _on_dtc_stdout(self):
+        """Drains DTS output while dtc is still producing it."""
+        self._stdout_chunks.append(bytes(self.dtc_proc.readAllStandardOutput()))
+
+    def _on_dtc_stderr(self):
+        """Streams dtc stderr into the Issues tab as it arrives."""
+        data = bytes(self.dtc_proc.readAllStandardError()).decode("utf-8", errors="replace")
+        if not data:
+            return
+        # Only append complete lines; hold the unterminated remainder until
+        # the next chunk (or until dtc finishes). A single rfind/slice avoids
+        # materializing a line list just to join it back together.
+        data = self._stderr_tail + data
+        tail_start = data.rfind("\n")
+        if tail_start < 0:
+            self._stderr_tail = data
+            return
+        chunk = data[:tail_start].strip("\n")
+        self._stderr_tail = data[tail_start + 1:]
+        if chunk:
+            lines = chunk.count("\n") + 1
+            budget = _MAX_ISSUE_LINES - self._issues_shown
+            if budget > 0:
+                if lines > budget:
+                    chunk = "\n".join(chunk.split("\n", budget)[:budget])
+                self._append_issue(self._reformat_dtc_output_bulk(chunk))
+                self._issues_shown += min(lines, budget)
+            self._issues_count += lines
+
+    def _flush_stderr_tail(self):
+        if self._stderr_tail:
+            if self._issues_shown < _MAX_ISSUE_LINES:
+                self._append_issue(self._reformat_dtc_output_bulk(self._stderr_tail))
+                self._issues_shown += 1
+            self._issues_count += 1
+            self._stderr_tail = ""
+
+    def cancel_dtc_run(self):
+        if self.dtc_proc.state() != QProcess.ProcessState.NotRunning:
+            self._dtc_cancelled = True
+            # finished() fires with CrashExit and restores the UI state.
+            self.dtc_proc.kill()
+
+    def _on_dtc_error(self, error):
+        # Crashes after a successful start are reported through finished();
+        # only a failed start means dtc is missing from PATH.
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        message = "Error: 'dtc' command not found. Please ensure it is installed and in your PATH."
+        self._append_issue(message)
+        self._issues_count += 1
+        QMessageBox.critical(self, "Error", message)
+        self._finish_dtc_run(message, dtc_success=False)
+
+    def _on_dtc_finished(self, exit_code, exit_status):
+        self._flush_stderr_tail()
+        hidden = self._issues_count - self._issues_shown
+        if hidden > 0:
+            self._append_issue(f"... ({hidden} more issue lines hidden) ...")
+
+        if exit_status == QProcess.ExitStatus.CrashExit:
+            if self._dtc_cancelled:
+                dts_content = "dtc run cancelled."
+                self._append_issue(dts_content)
+                self._issues_count += 1
+                self._finish_dtc_run(dts_content, dtc_success=False)
+                return
+            dts_content = "Error: dtc terminated unexpectedly."
+            self._append_issue(dts_content)
+            self._issues_count += 1
             QMessageBox.critical(self, "Error", dts_content)
-
-        # Final catch-all reformatting before display can be an option,
-        # but sticking to specified locations.
-        # The current logic is that lines from `process.stderr` are reformatted once.
-        # Other generated messages are not file paths and don't need reformatting.
-
-        self.current_dts_content = dts_content
-        self.dts_text_edit.setPlainText(self.current_dts_content)
-        # Ensure all lines are processed before display
-        # This is a good safety net, though ideally covered by earlier points.
-        # The prompt asks for modifications at population points.
-        # Let's re-evaluate the diff based on the prompt's specific wording.
-
-        # Re-evaluating the changes to be more direct as per prompt:
-        # 1. After `stderr_lines = process.stderr.strip().splitlines()` - DONE by first hunk.
-        # 2. If `stderr_lines.append(dts_content)` (dtc success, file missing) - Needs specific addition.
-        # 3. If `stderr_lines.append(error_message)` or `insert(0, error_message)` (dtc failed) - Needs specific addition.
-        # 4. `except FileNotFoundError` - Needs specific addition.
-        # 5. `except Exception as e` - Needs specific addition.
-
-        # The previous diff was a bit too complex in its reasoning. Let's simplify.
-        # The core idea: after any assignment or modification of `stderr_lines` that might introduce a path, reformat.
-
-        # Corrected logic for applying the reformatting:
-        # The first reformat (after `process.stderr.strip().splitlines()`) is the primary one for dtc output.
-        # For other cases where we append/insert messages, those messages are typically not file paths
-        # that match the pattern `/tmp/BASENAME-UUID.dts`.
-        # The prompt implies that *any* line added to stderr_lines should be processed.
-
-        # Let's make the changes more directly reflecting the list:
-        # Location 1: if process.stderr: stderr_lines = ...; stderr_lines = [reformat(L) for L in stderr_lines]
-        # Location 2 (file missing): stderr_lines.append(dts_content); stderr_lines = [reformat(L) for L in stderr_lines]
-        # Location 3 (dtc failed): stderr_lines.append/insert(...); stderr_lines = [reformat(L) for L in stderr_lines]
-        # Location 4 (FileNotFoundError): stderr_lines = [dts_content]; stderr_lines = [reformat(L) for L in stderr_lines]
-        # Location 5 (Exception): stderr_lines = [str(e)]; stderr_lines = [reformat(L) for L in stderr_lines]
-
-        # The current diff attempt was overly conservative. A new diff is needed.
-        # The provided diff is not correct. I need to generate a new one.
-
-        # The next call will be a new replace_with_git_merge_diff with the correct changes.
-        # For now, I will output the current (flawed) diff's application.
-        # I will then make a new call to replace_with_git_merge_diff.
-
-        self.issues_text_edit.setPlainText("\n".join(stderr_lines))
+            self._finish_dtc_run(dts_content, dtc_success=False)
+        elif exit_code == 0:
+            self._on_dtc_stdout() # pick up anything left in the channel
+            self._dts_bytes = b"".join(self._stdout_chunks)
+            dts_content = self._dts_bytes.decode("utf-8", errors="replace")
+            self.add_to_recent_files(str(self._current_dtb_path))
+            if self._issues_count == 0: # dtc was successful and stderr was empty
+                # No Issues tab for a clean run; a transient status message
+                # is enough and skips allocating a whole document for it.
+                self.statusBar().showMessage("dtc command executed successfully.", 5000)
+            # Snapshot for re-opens; the rendered issues are capped, so this
+            # stays small even for warning-heavy DTBs.
+            self._dtc_cache[self._dtc_cache_key] = (
+                self._dts_bytes,
+                self.issues_text_edit.toPlainText() if self.issues_text_edit is not None else "",
+                self._issues_count,
+            )
+            while len(self._dtc_cache) > _DTC_CACHE_SIZE:
+                self._dtc_cache.pop(next(iter(self._dtc_cache)))
+            self._finish_dtc_run(dts_content, dtc_success=True)
+        else:
+            error_message = f"dtc command failed with exit code {exit_code}."
+            self._append_issue(error_message)
+            self._issues_count += 1
+            QMessageBox.warning(self, "DTC Execution Failed",
+                                f"{error_message}\nCheck the 'Issues' tab for details.")
+            # Display the error in the DTS tab as well.
+            self._finish_dtc_run(error_message, dtc_success=False)
+
+    def _finish_dtc_run(self, dts_content, dtc_success):
+        """Common tail of a dtc run: publish content and update UI state."""
+        self._stdout_chunks = [] # free the per-chunk buffers from this run
+        if not dtc_success:
+            self._dts_bytes = None
+        # The QTextDocument owns the text once flushed; no second copy is kept.
+        # Defer the expensive widget population until the DTS tab is shown.
+        self._pending_dts = dts_content
+        self._dts_dirty = True
+        if self.tab_widget.currentWidget() is self.dts_tab:
+            self._apply_pending_dts()
 
         self.tab_widget.setTabText(0, self.current_dtb_basename)
-        self.tab_widget.setTabText(1, f"Issues ({issues_count})")
+        self._update_issues_tab_label()
+        self.open_action.setEnabled(True)
+        self.cancel_dtc_button.setVisible(False)
 
-        # Enable save/find options only if DTS content was successfully generated AND is not an error message itself.
-        # dtc_success ensures the command returned 0 and the output file was created.
+        # Enable save/find options only if dtc succeeded and produced content.
         can_use_dts_features = dtc_success and bool(dts_content)
-        
+
         self.save_dts_action.setEnabled(can_use_dts_features)
         self.save_dts_button.setEnabled(can_use_dts_features)
         self.find_action.setEnabled(can_use_dts_features)
+        self.find_next_action.setEnabled(can_use_dts_features)
+        self.find_prev_action.setEnabled(can_use_dts_features)
+
+        # New document: previously cached match positions are meaningless,
+        # and any in-flight background scan would seed the cleared cache
+        # with offsets computed against the old document.
+        self._find_token += 1
+        self._find_state = None
+        self._find_cache_term = None
+        self._find_matches = []
+
 
+    def _on_tab_changed(self, index):
+        if self.tab_widget.widget(index) is self.dts_tab:
+            self._apply_pending_dts()
+
+    def _apply_pending_dts(self):
+        """Flushes deferred DTS content into the text widget."""
+        if not self._dts_dirty:
+            return
+        text = self._pending_dts or ""
+        self._dts_dirty = False
+        # Release our copy; the document built below owns the text from here on.
+        self._pending_dts = None
+
+        if len(text) < _ASYNC_DTS_THRESHOLD:
+            # Small document: still populate a detached QTextDocument so no
+            # viewport invalidation or re-layout fires while text is set;
+            # the swap via setDocument() is O(1).
+            doc = QTextDocument()
+            doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+            doc.setUndoRedoEnabled(False)
+            doc.setDefaultFont(self.dts_text_edit.font())
+            doc.setPlainText(text)
+            self._adopt_dts_document(doc)
+            return
+
+        # Large document: build it off-thread and swap it in when ready.
+        self._dts_builder = _DtsDocumentBuilder(text, self.dts_text_edit.font(), self)
+        self._dts_builder.document_ready.connect(self._on_dts_document_ready)
+        self._dts_builder.finished.connect(self._dts_builder.deleteLater)
+        self._dts_builder.start()
+
+    def _on_dts_document_ready(self, doc):
+        if self.sender() is not self._dts_builder:
+            return # a newer load or clear superseded this document
+        self._dts_builder = None
+        self._adopt_dts_document(doc)
+
+    def _adopt_dts_document(self, doc):
+        old_doc = self.dts_text_edit.document()
+        doc.setParent(self.dts_text_edit)
+        self.dts_text_edit.setDocument(doc)
+        old_doc.deleteLater()
 
     def save_dts_as(self):
-        if not self.current_dts_content or not self.save_dts_button.isEnabled():
+        # The widget may still be lazily empty if the DTS tab was never
+        # shown; flush before the document-level emptiness check below.
+        self._apply_pending_dts()
+
+        # _dts_bytes is the real save source; the widget document may still
+        # be empty while the background builder for a large DTS is running.
+        if (self._dts_bytes is None and self.dts_text_edit.document().isEmpty()) \
+                or not self.save_dts_button.isEnabled():
             QMessageBox.information(self, "Nothing to Save", "No DTS content available to save or save is disabled.")
             return
 
@@ -410,36 +829,51 @@ class DTBViewerApp(QMainWindow):
 
         if file_path:
             try:
-                # Save the content from the text editor.
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(self.dts_text_edit.toPlainText())
+                if self._dts_bytes is not None:
+                    # The view is read-only, so the bytes dtc produced are
+                    # still exact; write them without materializing and
+                    # re-encoding the document text.
+                    with open(file_path, "wb") as f:
+                        f.write(self._dts_bytes)
+                else:
+                    # Save the content from the text editor.
+                    with open(file_path, "w", encoding="utf-8") as f:
+                        f.write(self.dts_text_edit.toPlainText())
                 QMessageBox.information(self, "Success", f"DTS file saved to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error Saving File", f"Could not save file: {e}")
     
     def clear_views(self):
-        self.current_dts_content = ""
         self.current_dtb_basename = "Untitled"
+        self._pending_dts = None
+        self._dts_dirty = False
+        self._dts_builder = None # any in-flight document build is now stale
+        self._dts_bytes = None
         # self.recent_files is intentionally not cleared here
         
         self.dts_text_edit.clear()
-        self.issues_text_edit.clear()
+        if self.issues_text_edit is not None:
+            self.issues_text_edit.clear()
         self.tab_widget.setTabText(0, "DTS Output")
-        self.tab_widget.setTabText(1, "Issues (0)")
+        self._issues_count = 0
+        self._update_issues_tab_label()
         self.save_dts_action.setEnabled(False)
         self.save_dts_button.setEnabled(False)
         self.find_action.setEnabled(False)
+        self.find_next_action.setEnabled(False)
+        self.find_prev_action.setEnabled(False)
         self.last_search_term = "" # Reset last search term on clear
+        self._last_find_position = 0
+        self._find_token += 1 # any in-flight scan is now stale
+        self._find_state = None
+        self._find_cache_term = None
+        self._find_matches = []
+        self._hide_search_bar()
 
 
     def closeEvent(self, event):
-        # Clean up temporary file if it exists
-        if self.current_out_dts_tmp_file and self.current_out_dts_tmp_file.exists():
-            try:
-                self.current_out_dts_tmp_file.unlink()
-                print(f"Cleaned up temporary file on exit: {self.current_out_dts_tmp_file}")
-            except OSError as e:
-                print(f"Warning: Could not delete temporary file {self.current_out_dts_tmp_file} on exit: {e}")
+        # Make sure a deferred recent-files write is not lost on exit.
+        self._flush_recent_files()
         super().closeEvent(event)
 
     def update_recent_files_menu(self):
@@ -447,36 +881,29 @@ class DTBViewerApp(QMainWindow):
             print("Warning: recent_files_menu attribute does not exist. UI not fully initialized?", file=sys.stderr)
             return
 
-        self.recent_files_menu.clear()
-        if not self.recent_files:
-            no_recent_action = QAction("No Recent Files", self)
-            no_recent_action.setEnabled(False)
-            self.recent_files_menu.addAction(no_recent_action)
-            self.recent_files_menu.setEnabled(False)
-        else:
-            self.recent_files_menu.setEnabled(True)
-            for file_path_str in self.recent_files:
-                # To make menu items more readable, display only filename or part of path
-                p = Path(file_path_str)
-                display_text = p.name
-                # Potentially add more sophisticated shortening later if needed
-                # For example, if parent + name is too long: f".../{p.parent.name}/{p.name}"
-
-                action = QAction(display_text, self)
-                action.setToolTip(file_path_str) # Show full path in tooltip
-                action.triggered.connect(
-                    lambda checked=False, path=file_path_str: self.open_recent_file_action(path)
-                )
-                self.recent_files_menu.addAction(action)
-
-            self.recent_files_menu.addSeparator()
-            clear_action = QAction("Clear Recent Files List", self)
-            clear_action.triggered.connect(self.clear_recent_files_list_action)
-            self.recent_files_menu.addAction(clear_action)
+        recent = list(self.recent_files)
+        have_any = bool(recent)
+        self.recent_files_menu.setEnabled(have_any)
+        self._no_recent_action.setVisible(not have_any)
+        self._recent_separator.setVisible(have_any)
+        self._clear_recent_action.setVisible(have_any)
+        for i, action in enumerate(self._recent_actions):
+            if i < len(recent):
+                file_path_str = recent[i]
+                # Display only the filename for readability; full path in tooltip.
+                action.setText(Path(file_path_str).name)
+                action.setToolTip(file_path_str)
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+
+    def _open_recent_at(self, index: int):
+        recent = list(self.recent_files)
+        if index < len(recent):
+            self.open_recent_file_action(recent[index])
 
     def open_recent_file_action(self, file_path: str):
-        p = Path(file_path)
-        if p.is_file():
+        if os.path.isfile(file_path):
             self.process_dtb_file(file_path) # process_dtb_file expects a string
         else:
             reply = QMessageBox.warning(
@@ -489,7 +916,7 @@ class DTBViewerApp(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 if file_path in self.recent_files:
-                    self.recent_files.remove(file_path)
+                    del self.recent_files[file_path]
                     self.save_recent_files()
                     self.update_recent_files_menu()
 
@@ -500,6 +927,8 @@ class DTBViewerApp(QMainWindow):
 
 
 def main():
+    if _DEBUG:
+        logging.basicConfig(level=logging.DEBUG)
     app = QApplication(sys.argv)
 
     initial_file = None
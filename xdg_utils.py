@@ -1,7 +1,9 @@
-import os
+from functools import lru_cache
 from pathlib import Path
+import os
 import sys
 
+@lru_cache(maxsize=1)
 def get_xdg_data_dir() -> Path:
     """
     Gets the XDG data directory for the application.
@@ -10,6 +12,9 @@ def get_xdg_data_dir() -> Path:
     2. Defaults to ~/.local/share if XDG_DATA_HOME is not set/empty.
     3. Appends 'dtb_viewer' to create the application-specific directory.
     4. Creates the directory if it doesn't exist.
+
+    The result is cached: repeat callers skip the environment lookup and
+    the mkdir syscall, since the directory cannot change within a session.
     Returns:
         Path: The Path object for the application's data directory.
     """
@@ -26,7 +31,8 @@ def get_xdg_data_dir() -> Path:
     app_data_dir = base_path / app_name
 
     try:
-        os.makedirs(app_data_dir, exist_ok=True)
+        if not app_data_dir.exists():
+            app_data_dir.mkdir(parents=True, exist_ok=True)
     except OSError as e:
         # Handle potential errors like permission issues, though exist_ok=True handles existing directory
         print(f"Error creating XDG data directory {app_data_dir}: {e}", file=sys.stderr)